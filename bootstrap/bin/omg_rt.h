@@ -2684,6 +2684,7 @@ static Value omg_call_builtin(Value name, Value args) {
         if (strcmp(n, "pow") == 0)        return omg_builtin_pow(a[0], a[1]);
         if (strcmp(n, "binary") == 0)     return omg_builtin_binary2(a[0], a[1]);
         if (strcmp(n, "has_key") == 0)    return omg_has_key(a[0], a[1]);
+        if (strcmp(n, "list_repeat") == 0) return omg_list_repeat(a[0], a[1]);
         if (strcmp(n, "file_open") == 0)  return omg_builtin_file_open(a[0], a[1]);
         if (strcmp(n, "file_write") == 0) return omg_builtin_file_write(a[0], a[1]);
         if (strcmp(n, "file_seek") == 0)  return omg_builtin_file_seek(a[0], a[1]);
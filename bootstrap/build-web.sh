@@ -50,7 +50,20 @@ EXAMPLES=(
     tabula_recta
 )
 
+# A pair is rebuilt only when its .js is missing or older than any
+# input: the example source, the compiler/transpiler binaries, or the
+# omg_rt.js that omgjs inlines into every output. Re-running the script
+# after touching one example (or nothing) skips the rest.
+example_is_fresh() {
+    local out="$1" src="$2" dep
+    [ -f "$out" ] || return 1
+    for dep in "$src" "$OMG" "$OMGJS_NATIVE" bootstrap/bin/omg_rt.js; do
+        [ "$out" -nt "$dep" ] || return 1
+    done
+}
+
 count=0
+rebuilt=0
 manifest_entries=()
 for name in "${EXAMPLES[@]}"; do
     src="examples/$name.omg"
@@ -58,8 +71,11 @@ for name in "${EXAMPLES[@]}"; do
         continue
     fi
     cp "$src" "$WEB_OUT/$name.omg"
-    "$OMG" --compile "$src" "$WORK/$name.omgb" >/dev/null
-    "$OMGJS_NATIVE" "$WORK/$name.omgb" "$WEB_OUT/$name.js" >/dev/null
+    if ! example_is_fresh "$WEB_OUT/$name.js" "$src"; then
+        "$OMG" --compile "$src" "$WORK/$name.omgb" >/dev/null
+        "$OMGJS_NATIVE" "$WORK/$name.omgb" "$WEB_OUT/$name.js" >/dev/null
+        rebuilt=$((rebuilt + 1))
+    fi
     manifest_entries+=("\"$name\"")
     count=$((count + 1))
 done
@@ -70,7 +86,7 @@ done
 manifest_csv=$(IFS=,; echo "${manifest_entries[*]}")
 printf '[%s]\n' "$manifest_csv" > "$WEB_OUT/manifest.json"
 
-echo "Built $count reference example pairs in $WEB_OUT/ (+ manifest.json)"
+echo "Built $count reference example pairs in $WEB_OUT/ ($rebuilt rebuilt, + manifest.json)"
 
 echo
 echo "Serve the playground:"
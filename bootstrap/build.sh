@@ -89,13 +89,20 @@ echo "[2/4] Installing runtime headers"
 cp "$SRC_DIR/omg_rt.h"  "$BIN_DIR/omg_rt.h"
 cp "$SRC_DIR/omg_rt.js" "$BIN_DIR/omg_rt.js"
 
-echo "[3/4] Building toolchain core (omgc, omgcc, omgjs)"
+# omgc and omgcc rebuild in order: in native mode each later step
+# runs through the binaries the earlier ones just replaced.
+echo "[3/4] Building toolchain core (omgc, omgcc)"
 build_binary "$SRC_DIR/compiler.omg"  "$BIN_DIR/omgc"
 build_binary "$SRC_DIR/native-c.omg"  "$BIN_DIR/omgcc"
-build_binary "$SRC_DIR/native-js.omg" "$BIN_DIR/omgjs"
 
-echo "[4/4] Building unified driver (omg)"
-build_binary "$SRC_DIR/omg.omg"      "$BIN_DIR/omg"
+# omgjs and omg only need the fresh omgc + omgcc, not each other, so
+# they build concurrently. `wait <pid>` returns the job's exit status,
+# so a failed omgjs build still aborts the script under `set -e`.
+echo "[4/4] Building omgjs + unified driver (omg)"
+build_binary "$SRC_DIR/native-js.omg" "$BIN_DIR/omgjs" &
+OMGJS_PID=$!
+build_binary "$SRC_DIR/omg.omg"       "$BIN_DIR/omg"
+wait "$OMGJS_PID"
 
 echo
 echo "Native toolchain in $BIN_DIR:"
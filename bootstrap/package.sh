@@ -41,7 +41,7 @@ done
 
 # === Sanity checks ===========================================================
 
-for f in compiler.omg vm.omg native-c.omg omg.omg omg_rt.h; do
+for f in compiler.omg vm.omg bytecode.omg native-c.omg omg.omg omg_rt.h; do
     if [ ! -f "$SRC_IN/$f" ]; then
         echo "ERROR: missing $SRC_IN/$f" >&2
         exit 1
@@ -58,9 +58,18 @@ done
 
 # === Output prep =============================================================
 
+# --clean moves the old tree aside (a single rename on the same
+# filesystem) and deletes it in the background, so the unlink work
+# overlaps the copy steps below instead of delaying them. Waited on
+# before the summary so the script never exits with the delete still
+# running.
+CLEAN_PID=""
 if [ "$CLEAN" = 1 ] && [ -d "$DIST_DIR" ]; then
     echo "[clean] removing $DIST_DIR"
-    rm -rf "$DIST_DIR"
+    STALE_DIR="$DIST_DIR.stale.$$"
+    mv "$DIST_DIR" "$STALE_DIR"
+    rm -rf "$STALE_DIR" &
+    CLEAN_PID=$!
 fi
 
 mkdir -p "$DIST_DIR"/{src,bin,examples,tools,tests,docs}
@@ -69,7 +78,7 @@ mkdir -p "$DIST_DIR"/{src,bin,examples,tools,tests,docs}
 # Mirrors bootstrap/src/
 
 echo "[1/7] src/  — OMG sources + runtime headers"
-for f in compiler.omg vm.omg native-c.omg native-js.omg omg.omg omg_rt.h omg_rt.js; do
+for f in compiler.omg vm.omg bytecode.omg native-c.omg native-js.omg omg.omg omg_rt.h omg_rt.js; do
     cp "$SRC_IN/$f" "$DIST_DIR/src/$f"
 done
 
@@ -118,9 +127,16 @@ for f in "$DIST_DIR/tests"/*.sh "$DIST_DIR/tests/README.md"; do
         "$f"
 done
 
+# Each rewrite below edits a different file, so the python3 helpers
+# run concurrently rather than back-to-back — every one pays its own
+# interpreter start-up, and serially those dominate this step. The
+# pids are collected and waited on before docs/ so a failing rewrite
+# still aborts the script under `set -e`.
+REWRITE_PIDS=()
+
 # Drop Rust-runtime checks from lib.sh + add native-only helpers
 # (assert_native_paths, build_aot) that test files in this dist use.
-python3 - "$DIST_DIR/tests/lib.sh" <<'PY'
+python3 - "$DIST_DIR/tests/lib.sh" <<'PY' &
 import sys, re
 p = sys.argv[1]
 src = open(p).read()
@@ -173,11 +189,12 @@ if 'assert_native_paths' not in src:
     src = src.rstrip() + '\n' + helpers
 open(p, 'w').write(src)
 PY
+REWRITE_PIDS+=($!)
 
 # Rewrite builtins.sh / driver.sh to drop OMG_RUST-only assertions
 # and replace assert_both_paths (which compares Rust vs native) with
 # assert_native_paths (which compares interpreted vs AOT).
-python3 - "$DIST_DIR/tests/builtins.sh" <<'PY'
+python3 - "$DIST_DIR/tests/builtins.sh" <<'PY' &
 import sys, re
 p = sys.argv[1]
 src = open(p).read()
@@ -239,9 +256,10 @@ src = re.sub(r'\n{3,}', '\n\n', src)
 
 open(p, 'w').write(src)
 PY
+REWRITE_PIDS+=($!)
 
 # Same treatment for driver.sh and repl.sh.
-python3 - "$DIST_DIR/tests/driver.sh" <<'PY'
+python3 - "$DIST_DIR/tests/driver.sh" <<'PY' &
 import sys, re
 p = sys.argv[1]
 src = open(p).read()
@@ -274,8 +292,9 @@ src = src.replace('assert_both_paths', 'assert_native_paths')
 src = re.sub(r'\n{3,}', '\n\n', src)
 open(p, 'w').write(src)
 PY
+REWRITE_PIDS+=($!)
 
-python3 - "$DIST_DIR/tests/repl.sh" <<'PY'
+python3 - "$DIST_DIR/tests/repl.sh" <<'PY' &
 import sys, re
 p = sys.argv[1]
 src = open(p).read()
@@ -307,10 +326,11 @@ src = drop_rust_named_asserts(src)
 src = re.sub(r'\n{3,}', '\n\n', src)
 open(p, 'w').write(src)
 PY
+REWRITE_PIDS+=($!)
 
 # Drop sections of parity.sh + regression.sh that compare against Rust.
 # Parity is now between native interpreted and native AOT only.
-python3 - "$DIST_DIR/tests/parity.sh" <<'PY'
+python3 - "$DIST_DIR/tests/parity.sh" <<'PY' &
 import sys, re
 p = sys.argv[1]
 src = open(p).read()
@@ -350,8 +370,9 @@ src = re.sub(
 )
 open(p, 'w').write(src)
 PY
+REWRITE_PIDS+=($!)
 
-python3 - "$DIST_DIR/tests/regression.sh" <<'PY'
+python3 - "$DIST_DIR/tests/regression.sh" <<'PY' &
 import sys, re
 p = sys.argv[1]
 src = open(p).read()
@@ -392,6 +413,11 @@ src = re.sub(
 src = re.sub(r'\n{3,}', '\n\n', src)
 open(p, 'w').write(src)
 PY
+REWRITE_PIDS+=($!)
+
+for pid in "${REWRITE_PIDS[@]}"; do
+    wait "$pid"
+done
 
 # === docs/ ==================================================================
 
@@ -474,13 +500,18 @@ echo "[2/4] Installing runtime headers"
 cp "$SRC_DIR/omg_rt.h"  "$BIN_DIR/omg_rt.h"
 cp "$SRC_DIR/omg_rt.js" "$BIN_DIR/omg_rt.js"
 
-echo "[3/4] Building toolchain core (omgc, omgcc, omgjs)"
+# omgc and omgcc rebuild in order: each later step runs through the
+# binaries the earlier ones just replaced. omgjs and omg only need
+# those two, so they build concurrently.
+echo "[3/4] Building toolchain core (omgc, omgcc)"
 build_binary "$SRC_DIR/compiler.omg"  "$BIN_DIR/omgc"
 build_binary "$SRC_DIR/native-c.omg"  "$BIN_DIR/omgcc"
-build_binary "$SRC_DIR/native-js.omg" "$BIN_DIR/omgjs"
 
-echo "[4/4] Building unified driver (omg)"
+echo "[4/4] Building omgjs + unified driver (omg)"
+build_binary "$SRC_DIR/native-js.omg" "$BIN_DIR/omgjs" &
+OMGJS_PID=$!
 build_binary "$SRC_DIR/omg.omg"       "$BIN_DIR/omg"
+wait "$OMGJS_PID"
 
 echo
 echo "Native toolchain in $BIN_DIR:"
@@ -575,6 +606,7 @@ omglang-native/
 ├── src/              all OMG source + the C runtime header
 │   ├── compiler.omg     OMG compiler, in OMG
 │   ├── vm.omg           OMG-in-OMG bytecode VM
+│   ├── bytecode.omg     .omgb reader shared by the transpilers
 │   ├── native-c.omg     OMG-to-C transpiler
 │   ├── omg.omg          unified driver
 │   └── omg_rt.h         C runtime header
@@ -597,7 +629,17 @@ EOF
 if [ "$TARBALL" = 1 ]; then
     echo
     echo "[+] producing $DIST_ROOT/omglang-native.tar.gz"
-    (cd "$DIST_ROOT" && tar -czf omglang-native.tar.gz omglang-native)
+    # pigz is a drop-in parallel gzip: same .tar.gz format, compressed
+    # on every core. Fall back to tar's built-in single-threaded gzip.
+    if command -v pigz >/dev/null 2>&1; then
+        (cd "$DIST_ROOT" && tar --use-compress-program=pigz -cf omglang-native.tar.gz omglang-native)
+    else
+        (cd "$DIST_ROOT" && tar -czf omglang-native.tar.gz omglang-native)
+    fi
+fi
+
+if [ -n "$CLEAN_PID" ]; then
+    wait "$CLEAN_PID"
 fi
 
 # === Summary ================================================================
@@ -225,47 +225,40 @@ mod opcode {
 
 // --- Little-endian readers -------------------------------------------------
 
+/// Take the next `N` bytes as a fixed-size array and advance `idx`. A
+/// single `get` covers both the bounds check and the slice, so the
+/// typed readers below are just a `from_le_bytes` on top.
+fn read_array<const N: usize>(
+    data: &[u8],
+    idx: &mut usize,
+    what: &str,
+) -> Result<[u8; N], RuntimeError> {
+    let bytes = data
+        .get(*idx..)
+        .and_then(|rest| rest.first_chunk::<N>())
+        .ok_or_else(|| RuntimeError::SyntaxError(format!("truncated bytecode ({})", what)))?;
+    *idx += N;
+    Ok(*bytes)
+}
+
 fn read_u32(data: &[u8], idx: &mut usize) -> Result<u32, RuntimeError> {
-    if *idx + 4 > data.len() {
-        return Err(RuntimeError::SyntaxError(
-            "truncated bytecode (u32)".to_string(),
-        ));
-    }
-    let bytes: [u8; 4] = data[*idx..*idx + 4].try_into().unwrap();
-    *idx += 4;
-    Ok(u32::from_le_bytes(bytes))
+    read_array(data, idx, "u32").map(u32::from_le_bytes)
 }
 
 fn read_i64(data: &[u8], idx: &mut usize) -> Result<i64, RuntimeError> {
-    if *idx + 8 > data.len() {
-        return Err(RuntimeError::SyntaxError(
-            "truncated bytecode (i64)".to_string(),
-        ));
-    }
-    let bytes: [u8; 8] = data[*idx..*idx + 8].try_into().unwrap();
-    *idx += 8;
-    Ok(i64::from_le_bytes(bytes))
+    read_array(data, idx, "i64").map(i64::from_le_bytes)
 }
 
 fn read_f64(data: &[u8], idx: &mut usize) -> Result<f64, RuntimeError> {
-    if *idx + 8 > data.len() {
-        return Err(RuntimeError::SyntaxError(
-            "truncated bytecode (f64)".to_string(),
-        ));
-    }
-    let bytes: [u8; 8] = data[*idx..*idx + 8].try_into().unwrap();
-    *idx += 8;
-    Ok(f64::from_le_bytes(bytes))
+    read_array(data, idx, "f64").map(f64::from_le_bytes)
 }
 
 fn read_string(data: &[u8], idx: &mut usize) -> Result<String, RuntimeError> {
     let len = read_u32(data, idx)? as usize;
-    if *idx + len > data.len() {
-        return Err(RuntimeError::SyntaxError(
-            "truncated bytecode (string)".to_string(),
-        ));
-    }
-    let s = std::str::from_utf8(&data[*idx..*idx + len])
+    let bytes = data.get(*idx..).and_then(|rest| rest.get(..len)).ok_or_else(|| {
+        RuntimeError::SyntaxError("truncated bytecode (string)".to_string())
+    })?;
+    let s = std::str::from_utf8(bytes)
         .map_err(|e| RuntimeError::SyntaxError(format!("invalid UTF-8 in bytecode: {}", e)))?
         .to_string();
     *idx += len;
@@ -341,6 +334,9 @@ pub fn parse_bytecode(
 
     let code_len = read_u32(data, &mut idx)? as usize;
     let mut code = Vec::with_capacity(code_len);
+    // Highest JUMP / JUMP_IF_FALSE / SETUP_EXCEPT target seen, so the
+    // targets can be validated with one comparison after decoding.
+    let mut max_target = 0usize;
     for _ in 0..code_len {
         if idx >= data.len() {
             return Err(RuntimeError::SyntaxError(
@@ -389,9 +385,15 @@ pub fn parse_bytecode(
             NEG => code.push(Instr::Neg),
             INDEX => code.push(Instr::Index),
             SLICE => code.push(Instr::Slice),
-            JUMP => code.push(Instr::Jump(read_u32(data, &mut idx)? as usize)),
+            JUMP => {
+                let target = read_u32(data, &mut idx)? as usize;
+                max_target = max_target.max(target);
+                code.push(Instr::Jump(target))
+            }
             JUMP_IF_FALSE => {
-                code.push(Instr::JumpIfFalse(read_u32(data, &mut idx)? as usize))
+                let target = read_u32(data, &mut idx)? as usize;
+                max_target = max_target.max(target);
+                code.push(Instr::JumpIfFalse(target))
             }
             CALL => code.push(Instr::Call(read_string(data, &mut idx)?)),
             TCALL => code.push(Instr::TailCall(read_string(data, &mut idx)?)),
@@ -411,7 +413,9 @@ pub fn parse_bytecode(
             ASSERT => code.push(Instr::Assert),
             CALL_VALUE => code.push(Instr::CallValue(read_u32(data, &mut idx)? as usize)),
             SETUP_EXCEPT => {
-                code.push(Instr::SetupExcept(read_u32(data, &mut idx)? as usize))
+                let target = read_u32(data, &mut idx)? as usize;
+                max_target = max_target.max(target);
+                code.push(Instr::SetupExcept(target))
             }
             POP_BLOCK => code.push(Instr::PopBlock),
             RAISE => {
@@ -440,6 +444,47 @@ pub fn parse_bytecode(
         }
     }
 
+    // A branch may land one past the last instruction (the VM treats
+    // pc == code.len() as falling off the end), but no further. As with
+    // function addresses below, the scan that names the offending
+    // instruction only runs once the max says something is wrong.
+    if max_target > code_len {
+        let (at, target) = code
+            .iter()
+            .enumerate()
+            .find_map(|(i, instr)| match instr {
+                Instr::Jump(t) | Instr::JumpIfFalse(t) | Instr::SetupExcept(t)
+                    if *t > code_len =>
+                {
+                    Some((i, *t))
+                }
+                _ => None,
+            })
+            .expect("max_target came from a branch instruction");
+        return Err(RuntimeError::SyntaxError(format!(
+            "instruction {} branches to {} but code length is {}",
+            at, target, code_len
+        )));
+    }
+
+    // Every function must start inside the instruction stream, or the
+    // first call to it would run off the end of `code`. One max over the
+    // table covers the common all-valid case; the per-function scan that
+    // names the culprit only runs once we know something is wrong.
+    if funcs.values().map(|f| f.address).max().is_some_and(|a| a >= code_len) {
+        let mut bad: Vec<(&String, usize)> = funcs
+            .iter()
+            .filter(|(_, f)| f.address >= code_len)
+            .map(|(name, f)| (name, f.address))
+            .collect();
+        bad.sort();
+        let (name, address) = bad[0];
+        return Err(RuntimeError::SyntaxError(format!(
+            "function '{}' starts at instruction {} but code length is {}",
+            name, address, code_len
+        )));
+    }
+
     // Source map — parallel to the instruction stream.
     let map_len = read_u32(data, &mut idx)? as usize;
     if map_len != code_len {
@@ -670,8 +715,50 @@ mod tests {
         assert_eq!(decoded_map.lookup(2), Some(("test.omg", 2)));
     }
 
+    #[test]
+    fn rejects_branch_target_past_code_end() {
+        let code = vec![Instr::PushBool(true), Instr::JumpIfFalse(4), Instr::Halt];
+        let bytes = write_bytecode(&code, &HashMap::new(), &SourceMap::default());
+        match parse_bytecode(&bytes) {
+            Err(RuntimeError::SyntaxError(msg)) => assert_eq!(
+                msg,
+                "instruction 1 branches to 4 but code length is 3"
+            ),
+            other => panic!("expected branch error, got {:?}", other.map(|_| ())),
+        }
+    }
+
+    #[test]
+    fn rejects_function_address_past_code_end() {
+        let code = vec![Instr::PushNone, Instr::Ret, Instr::Halt];
+        let mut funcs = HashMap::new();
+        funcs.insert(
+            "f".to_string(),
+            Function { params: Vec::new(), address: 3, source_file_idx: 0 },
+        );
+        let bytes = write_bytecode(&code, &funcs, &SourceMap::default());
+        match parse_bytecode(&bytes) {
+            Err(RuntimeError::SyntaxError(msg)) => assert_eq!(
+                msg,
+                "function 'f' starts at instruction 3 but code length is 3"
+            ),
+            other => panic!("expected address error, got {:?}", other.map(|_| ())),
+        }
+    }
+
     #[test]
     fn rejects_bad_magic() {
         assert!(parse_bytecode(b"NOPE\x01\x00\x00\x00").is_err());
     }
+
+    #[test]
+    fn rejects_truncated_header_field() {
+        let mut bytes = b"OMGB".to_vec();
+        bytes.extend_from_slice(&BC_VERSION.to_le_bytes());
+        bytes.extend_from_slice(&[1, 0]);
+        match parse_bytecode(&bytes) {
+            Err(RuntimeError::SyntaxError(msg)) => assert_eq!(msg, "truncated bytecode (u32)"),
+            other => panic!("expected truncation error, got {:?}", other.map(|_| ())),
+        }
+    }
 }
@@ -21,7 +21,7 @@
 
 use std::env;
 use std::fs;
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 use std::process::ExitCode;
 
 mod ast;
@@ -231,20 +231,25 @@ fn run_omg(path: &PathBuf, full_args: &[String]) -> Result<(), RuntimeError> {
 /// OMG-in-OMG compiler (running on the VM) and run the result. This is
 /// what bare `omg <script>` invokes when `--rust` isn't passed.
 fn run_omg_self_hosted(path: &PathBuf, full_args: &[String]) -> Result<(), RuntimeError> {
-    let bytes = self_hosted_compile(path)?;
+    let bytes = self_hosted_compile(&absolute_normalised(path))?;
     let (code, funcs, src_map) = parse_bytecode(&bytes)?;
     run(&code, &funcs, &src_map, full_args)
 }
 
 fn run_omgb(path: &PathBuf, full_args: &[String]) -> Result<(), RuntimeError> {
-    let bytes = fs::read(path).map_err(|e| {
-        RuntimeError::ModuleImportError(format!(
-            "Cannot read bytecode '{}': {}",
-            path.display(),
-            e
-        ))
-    })?;
-    let (code, funcs, src_map) = parse_bytecode(&bytes)?;
+    // The decoded program owns copies of every string it needs, so the
+    // raw file buffer is scoped to this block and freed before the VM
+    // starts rather than living for the whole run.
+    let (code, funcs, src_map) = {
+        let bytes = fs::read(path).map_err(|e| {
+            RuntimeError::ModuleImportError(format!(
+                "Cannot read bytecode '{}': {}",
+                path.display(),
+                e
+            ))
+        })?;
+        parse_bytecode(&bytes)?
+    };
     run(&code, &funcs, &src_map, full_args)
 }
 
@@ -320,7 +325,7 @@ fn cmd_self_hosted_compile(args: &[String]) -> ExitCode {
     }
     let in_path = PathBuf::from(&args[0]);
     let out: Option<PathBuf> = args.get(1).map(PathBuf::from);
-    let bytes = match self_hosted_compile(&in_path) {
+    let bytes = match self_hosted_compile(&absolute_normalised(&in_path)) {
         Ok(b) => b,
         Err(e) => {
             eprintln!("{}", e);
@@ -371,7 +376,7 @@ fn cmd_verify_self_hosted(args: &[String]) -> ExitCode {
             return ExitCode::FAILURE;
         }
     };
-    let omg_bytes = match self_hosted_compile(&in_path) {
+    let omg_bytes = match self_hosted_compile(&abs_in) {
         Ok(b) => b,
         Err(e) => {
             eprintln!("OMG frontend failed: {}", e);
@@ -400,15 +405,16 @@ fn cmd_verify_self_hosted(args: &[String]) -> ExitCode {
 /// the resulting `.omgb` bytes. Uses a temp file to thread the result back
 /// into the host process — the embedded compiler is a normal OMG program
 /// that takes [in.omg, out.omgb] as args and writes the bytecode to disk.
-fn self_hosted_compile(in_path: &PathBuf) -> Result<Vec<u8>, RuntimeError> {
+///
+/// `abs_in` must already be absolute and normalised (`./` and `..`
+/// collapsed) via [`absolute_normalised`]. Symlinks are NOT resolved —
+/// we deliberately don't use `fs::canonicalize` so the source-file table
+/// matches what the OMG-native driver produces (which has no
+/// symlink-resolving primitive). This keeps traceback paths consistent
+/// across all four implementations. Callers normalise once and reuse
+/// the result, so the verify commands don't redo it per frontend.
+fn self_hosted_compile(abs_in: &Path) -> Result<Vec<u8>, RuntimeError> {
     let (code, funcs, src_map) = parse_bytecode(SELF_HOSTED_COMPILER)?;
-    // Make the path absolute and normalised (`./` and `..` collapsed)
-    // before passing it to the embedded compiler. Symlinks are NOT
-    // resolved — we deliberately don't use `fs::canonicalize` here so
-    // the source-file table matches what the OMG-native driver
-    // produces (which has no symlink-resolving primitive). This keeps
-    // traceback paths consistent across all four implementations.
-    let abs_in = absolute_normalised(in_path);
     let tmp = std::env::temp_dir().join(format!(
         "omg-stage1-{}-{}.omgb",
         std::process::id(),
@@ -436,9 +442,9 @@ fn self_hosted_compile(in_path: &PathBuf) -> Result<Vec<u8>, RuntimeError> {
 /// path: the Rust runtime hosts the embedded `vm.omgb`, which interprets
 /// the embedded `compiler.omgb`, which compiles the user's source. Used
 /// only by `--verify-omg-vm`; ordinary execution doesn't need this layer.
-fn omg_vm_compile(in_path: &PathBuf) -> Result<Vec<u8>, RuntimeError> {
+/// Like [`self_hosted_compile`], `abs_in` is already normalised.
+fn omg_vm_compile(abs_in: &Path) -> Result<Vec<u8>, RuntimeError> {
     let (vm_code, vm_funcs, vm_src_map) = parse_bytecode(SELF_HOSTED_VM)?;
-    let abs_in = absolute_normalised(in_path);
     // The embedded VM expects to *read* the bytecode it's interpreting
     // from a file, the same way it would with `omg bootstrap/src/vm.omg
     // <prog.omgb>`. Stage the embedded compiler.omgb to a temp file so
@@ -510,7 +516,7 @@ fn cmd_verify_omg_vm(args: &[String]) -> ExitCode {
             return ExitCode::FAILURE;
         }
     };
-    let meta_bytes = match omg_vm_compile(&in_path) {
+    let meta_bytes = match omg_vm_compile(&abs_in) {
         Ok(b) => b,
         Err(e) => {
             eprintln!("OMG-on-OMG-VM failed: {}", e);
@@ -566,7 +572,10 @@ fn cmd_disasm(args: &[String]) -> ExitCode {
                 }
             }
         } else {
-            let source = String::from_utf8_lossy(&bytes).to_string();
+            // Reuse the read buffer as the source string; only invalid
+            // UTF-8 pays for the lossy re-encode copy.
+            let source = String::from_utf8(bytes)
+                .unwrap_or_else(|e| String::from_utf8_lossy(e.as_bytes()).into_owned());
             if let Err(e) = check_header(&source, &path) {
                 eprintln!("{}", e);
                 return ExitCode::FAILURE;
@@ -579,21 +588,39 @@ fn cmd_disasm(args: &[String]) -> ExitCode {
                 }
             }
         };
-    println!("# functions");
+    // One buffered writer over a single stdout lock: `println!` would
+    // re-lock stdout and go through the line-buffered writer once per
+    // instruction. A write error (e.g. a closed pipe under `| head`)
+    // ends the listing instead of panicking.
+    let stdout = std::io::stdout();
+    let mut out = std::io::BufWriter::new(stdout.lock());
+    if write_disasm(&mut out, &code, &funcs).is_err() {
+        return ExitCode::FAILURE;
+    }
+    ExitCode::SUCCESS
+}
+
+fn write_disasm(
+    out: &mut impl std::io::Write,
+    code: &[Instr],
+    funcs: &std::collections::HashMap<String, Function>,
+) -> std::io::Result<()> {
+    writeln!(out, "# functions")?;
     let mut names: Vec<&String> = funcs.keys().collect();
     names.sort();
     for name in names {
         let f = &funcs[name];
-        println!(
+        writeln!(
+            out,
             "FUNC {} ({}) @ {}",
             name,
             f.params.join(", "),
             f.address
-        );
+        )?;
     }
-    println!("# code");
+    writeln!(out, "# code")?;
     for (i, instr) in code.iter().enumerate() {
-        println!("{:04}  {:?}", i, instr);
+        writeln!(out, "{:04}  {:?}", i, instr)?;
     }
-    ExitCode::SUCCESS
+    out.flush()
 }
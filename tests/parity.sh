@@ -33,6 +33,17 @@ EXAMPLES=(
 
 cd "$REPO_ROOT"
 
+# Rust-runtime output per example, the reference every parity section
+# compares against. Filled on first use so each example runs under the
+# Rust VM once rather than once per section.
+declare -A RUST_OUT=()
+rust_reference() {
+    local src="$1"
+    if [ -z "${RUST_OUT[$src]+set}" ]; then
+        RUST_OUT[$src]=$("$OMG_RUST" "$src" 2>&1)
+    fi
+}
+
 # === Triple-meta fixed-point check ====================================
 section "Parity: triple-meta fixed-point"
 
@@ -73,7 +84,8 @@ for src in "${EXAMPLES[@]}"; do
     fi
     # Run the example from the repo root so relative paths in the
     # source resolve the same way the Rust runtime sees them.
-    rust_out=$("$OMG_RUST" "$src" 2>&1)
+    rust_reference "$src"
+    rust_out=${RUST_OUT[$src]}
     aot_out=$("$bin" 2>&1)
     if [ "$rust_out" = "$aot_out" ]; then
         pass "AOT == Rust: $name"
@@ -87,7 +99,8 @@ section "Parity: native interpreted (omg <file.omg>) vs Rust runtime"
 
 for src in "${EXAMPLES[@]}"; do
     name=$(basename "$src" .omg)
-    rust_out=$("$OMG_RUST" "$src" 2>&1)
+    rust_reference "$src"
+    rust_out=${RUST_OUT[$src]}
     nat_out=$("$OMG_NATIVE" "$src" 2>&1)
     if [ "$rust_out" = "$nat_out" ]; then
         pass "native == Rust: $name"
@@ -113,7 +126,8 @@ if command -v node >/dev/null 2>&1; then
             fail "JS == Rust: $name (transpile)"
             continue
         fi
-        rust_out=$("$OMG_RUST" "$src" 2>&1)
+        rust_reference "$src"
+        rust_out=${RUST_OUT[$src]}
         js_out=$(node "$jsfile" 2>&1)
         if [ "$rust_out" = "$js_out" ]; then
             pass "JS == Rust: $name"
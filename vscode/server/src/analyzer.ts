@@ -68,9 +68,11 @@ export function analyzeText(uri: string, text: string): OMGDocumentInfo {
     // Track brace depth to distinguish top-level from inside-fn
     let braceDepth = 0;
 
-    // When we're inside a proc body, remember its name + body extent so we
-    // can scope the params list correctly.
-    let activeProcStack: { name: string; startLine: number }[] = [];
+    // Top-level procs whose closing brace hasn't been reached yet. Their
+    // params' scopeEnd is filled in by the brace tracking at the bottom
+    // of the loop, so each body is scanned once rather than re-walked
+    // from its `proc` line.
+    let openProcs: { params: OMGSymbol[]; started: boolean }[] = [];
 
     for (let i = 0; i < lines.length; i++) {
         const line = lines[i];
@@ -127,8 +129,9 @@ export function analyzeText(uri: string, text: string): OMGDocumentInfo {
                 };
                 topLevel.push(sym);
 
-                // Find the body extent so params get a proper scope range.
-                const { closeLine } = findMatchingBrace(lines, i);
+                // scopeEnd is provisional: it becomes the body's closing
+                // line once the loop reaches it, and stays at end-of-file
+                // for an unbalanced body the user is still typing.
                 const paramSyms: OMGSymbol[] = params.map((p, idx) => ({
                     name: p,
                     kind: 'param',
@@ -138,12 +141,12 @@ export function analyzeText(uri: string, text: string): OMGDocumentInfo {
                     // Approximate column: just past the `(`.
                     col: line.indexOf('(') + 1 + idx,
                     scopeStart: i,
-                    scopeEnd: closeLine
+                    scopeEnd: lines.length - 1
                 }));
                 paramsByProc.set(name, paramSyms);
+                openProcs.push({ params: paramSyms, started: false });
             }
 
-            activeProcStack.push({ name, startLine: i });
             pendingDoc = undefined;
         } else if ((m = codeLine.match(ALLOC_RE)) && isTopLevel) {
             const indent = m[1] ?? '';
@@ -179,25 +182,24 @@ export function analyzeText(uri: string, text: string): OMGDocumentInfo {
         }
 
         // Update brace depth (ignoring braces inside string literals).
-        braceDepth += countBraces(codeLine);
+        const delta = countBraces(codeLine);
+        braceDepth += delta;
         if (braceDepth < 0) {
             braceDepth = 0;
         }
-        // Pop fn stack if we left a proc body.
-        while (
-            activeProcStack.length > 0 &&
-            braceDepth === 0 &&
-            i >= activeProcStack[activeProcStack.length - 1].startLine
-        ) {
-            // If we're back at brace depth 0 we're outside any proc.
-            // (Heuristic — good enough for line-based scoping.)
-            if (
-                line.includes('}') &&
-                lineClosesProc(lines, activeProcStack[activeProcStack.length - 1].startLine, i)
-            ) {
-                activeProcStack.pop();
-            } else {
-                break;
+        // A proc body ends on the first return to depth 0 after a line
+        // that opened a brace. (Heuristic — good enough for line-based
+        // scoping.)
+        if (openProcs.length > 0) {
+            if (delta > 0) {
+                for (const p of openProcs) p.started = true;
+            }
+            if (braceDepth === 0) {
+                openProcs = openProcs.filter((p) => {
+                    if (!p.started) return true;
+                    for (const sym of p.params) sym.scopeEnd = i;
+                    return false;
+                });
             }
         }
     }
@@ -264,40 +266,6 @@ function countBraces(line: string): number {
     return count;
 }
 
-/**
- * Heuristic: from the `proc name(...)` line, walk forward tracking braces
- * and return the line index where the matching `}` lives.
- */
-function findMatchingBrace(
-    lines: string[],
-    procLine: number
-): { closeLine: number } {
-    let depth = 0;
-    let started = false;
-    for (let i = procLine; i < lines.length; i++) {
-        const delta = countBraces(stripLineComment(lines[i]));
-        depth += delta;
-        if (delta > 0) started = true;
-        if (started && depth === 0) {
-            return { closeLine: i };
-        }
-    }
-    // Unbalanced — let the user keep typing.
-    return { closeLine: lines.length - 1 };
-}
-
-function lineClosesProc(
-    lines: string[],
-    procLine: number,
-    currentLine: number
-): boolean {
-    let depth = 0;
-    for (let i = procLine; i <= currentLine; i++) {
-        depth += countBraces(stripLineComment(lines[i]));
-    }
-    return depth <= 0;
-}
-
 function collectDocBlock(
     lines: string[],
     open: number,
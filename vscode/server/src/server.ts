@@ -63,6 +63,17 @@ const documents: TextDocuments<TextDocument> = new TextDocuments(TextDocument);
 const indexByUri = new Map<string, OMGDocumentInfo>();
 /** Source text per URI (we read imports from disk if not already open). */
 const textByUri = new Map<string, string>();
+/** Debounced re-index per open URI; see `scheduleIndex`. */
+const pendingIndex = new Map<string, ReturnType<typeof setTimeout>>();
+/** Quiet period after the last edit before an open document is re-analysed. */
+const REINDEX_DELAY_MS = 150;
+/**
+ * Memoised `resolveImportUri` hits, keyed by importing URI + raw path.
+ * Resolution stats the disk, and hover/completion/definition resolve the
+ * same imports on every request. Misses are not cached, so an import
+ * starts resolving as soon as its target file exists.
+ */
+const resolvedImports = new Map<string, string>();
 
 // --- Lifecycle -----------------------------------------------------------
 
@@ -85,13 +96,15 @@ documents.onDidOpen((e) => {
     indexDocument(e.document.uri, e.document.getText());
 });
 documents.onDidChangeContent((e) => {
-    indexDocument(e.document.uri, e.document.getText());
+    scheduleIndex(e.document.uri);
 });
 
 connection.onDidChangeWatchedFiles((change) => {
     // Files modified outside the editor (or imported targets the user
     // hasn't opened) — re-index from disk so cross-file go-to-def stays
-    // accurate.
+    // accurate. A create or delete can change what an import path
+    // resolves to, so drop the memoised resolutions too.
+    resolvedImports.clear();
     for (const event of change.changes) {
         const uri = event.uri;
         if (!uri.endsWith('.omg')) continue;
@@ -113,12 +126,19 @@ connection.listen();
 
 function indexDocument(uri: string, text: string): void {
     textByUri.set(uri, text);
+    const previous = indexByUri.get(uri);
     const info = analyzeText(uri, text);
     indexByUri.set(uri, info);
     // Eagerly index transitive imports so member completion works without
-    // the user having to open every imported file.
+    // the user having to open every imported file. Only imports added
+    // since this file was last analysed need following — the rest were
+    // handled then, and targets changed or created on disk since come in
+    // through onDidChangeWatchedFiles. Without this every keystroke
+    // re-stats every import of the file being edited.
+    const known = new Set(previous?.imports.map((imp) => imp.rawPath));
     for (const imp of info.imports) {
-        const target = resolveImportUri(uri, imp.rawPath);
+        if (known.has(imp.rawPath)) continue;
+        const target = resolveImport(uri, imp.rawPath);
         if (!target || indexByUri.has(target)) continue;
         try {
             const text = fs.readFileSync(URI.parse(target).fsPath, 'utf8');
@@ -129,7 +149,46 @@ function indexDocument(uri: string, text: string): void {
     }
 }
 
+/**
+ * Re-index an open document once edits to it pause, so a burst of
+ * keystrokes costs one analysis instead of one per change.
+ */
+function scheduleIndex(uri: string): void {
+    const prior = pendingIndex.get(uri);
+    if (prior !== undefined) clearTimeout(prior);
+    pendingIndex.set(uri, setTimeout(() => flushIndex(uri), REINDEX_DELAY_MS));
+}
+
+/**
+ * Run a pending re-index for `uri` now. Skips the analysis when the text
+ * is unchanged since it was last indexed (e.g. the change event that
+ * follows onDidOpen, or an edit that was undone).
+ */
+function flushIndex(uri: string): void {
+    const timer = pendingIndex.get(uri);
+    if (timer === undefined) return;
+    clearTimeout(timer);
+    pendingIndex.delete(uri);
+    const doc = documents.get(uri);
+    if (!doc) return;
+    const text = doc.getText();
+    if (textByUri.get(uri) === text) return;
+    indexDocument(uri, text);
+}
+
+function resolveImport(importingUri: string, rawPath: string): string | undefined {
+    const key = importingUri + '\n' + rawPath;
+    const hit = resolvedImports.get(key);
+    if (hit !== undefined) return hit;
+    const target = resolveImportUri(importingUri, rawPath);
+    if (target !== undefined) resolvedImports.set(key, target);
+    return target;
+}
+
 function getInfo(uri: string): OMGDocumentInfo | undefined {
+    // A request against a document with edits still pending must see
+    // them, so catch the index up before answering.
+    flushIndex(uri);
     return indexByUri.get(uri);
 }
 
@@ -218,7 +277,7 @@ function completeMembers(
     if (!importing) return [];
     const imp = importing.imports.find((i) => i.alias === aliasName);
     if (!imp) return [];
-    const targetUri = resolveImportUri(importingUri, imp.rawPath);
+    const targetUri = resolveImport(importingUri, imp.rawPath);
     if (!targetUri) return [];
     const target = getInfo(targetUri);
     if (!target) return [];
@@ -365,7 +424,7 @@ function symbolAtPosition(
         const importing = getInfo(params.textDocument.uri);
         const imp = importing?.imports.find((i) => i.alias === memberOf);
         if (imp) {
-            const targetUri = resolveImportUri(params.textDocument.uri, imp.rawPath);
+            const targetUri = resolveImport(params.textDocument.uri, imp.rawPath);
             if (targetUri) {
                 const target = getInfo(targetUri);
                 const found = target?.topLevel.find((s) => s.name === word);